@@ -1,13 +1,196 @@
-from sys import exit
-from os import cpu_count
-from shutil import which
+from sys import exit, stdout
+from os import cpu_count, environ, makedirs, remove, replace, scandir, sep, stat
+from os.path import abspath, basename, dirname, isfile, realpath
+from stat import S_ISDIR, S_ISREG
+from glob import glob
+from shutil import which, copy2
+from time import sleep, time
+from hashlib import blake2b
+from tempfile import NamedTemporaryFile
 from pathlib import Path
+from functools import lru_cache
 from typing import Any, Union
-from subprocess import check_output, STDOUT, CalledProcessError
-from argparse import ArgumentParser, Namespace
-from webbrowser import open_new_tab as open_browser_new_tab
-from pymediainfo import MediaInfo
+from subprocess import check_output, Popen, PIPE, STDOUT, CalledProcessError
+from argparse import Action, ArgumentParser, Namespace
+from dataclasses import dataclass, fields
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
+try:  # Prefer orjson for the media-info JSON hot path when it is installed
+    from orjson import dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps(value: Any) -> str:
+        return _orjson_dumps(value).decode()
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
+
+@lru_cache(maxsize=1)
+def _resolve_ffmpeg_path(path_env: str) -> Union[str, None]:
+    """
+    Resolve the absolute FFmpeg binary path for the given PATH environment value
+    :param path_env: Current PATH environment variable value
+    :return: Absolute FFmpeg binary path or None
+    """
+
+    found_path = which('ffmpeg')
+
+    return Path(found_path).resolve().as_posix() if found_path else None
+
+def get_ffmpeg_path() -> Union[str, None]:
+    """
+    Get the absolute path to the FFmpeg binary, resolving it once per PATH value
+    :return: Absolute FFmpeg binary path or None
+    """
+
+    return _resolve_ffmpeg_path(environ.get('PATH', ''))
+
+# Well-known encoders mapped to the stream type they produce (V=video, A=audio, S=subtitle)
+_COMMON_CODECS = {
+    'libsvtav1': 'V', 'libx264': 'V', 'libx265': 'V', 'libaom-av1': 'V', 'libvpx-vp9': 'V',
+    'libopus': 'A', 'libmp3lame': 'A', 'aac': 'A', 'flac': 'A',
+    'webvtt': 'S', 'mov_text': 'S', 'srt': 'S', 'ass': 'S',
+}
+
+@lru_cache(maxsize=4)
+def _get_ffmpeg_encoders(ffmpeg_path: str) -> Union[dict, None]:
+    """
+    Get the encoders provided by the local FFmpeg installation mapped to their stream type, cached on disk per binary identity
+    :param ffmpeg_path: Path to the FFmpeg binary
+    :return: Dictionary of encoder names to stream type letters (V/A/S) or None when the probe fails
+    """
+
+    try:
+        binary_stat = stat(ffmpeg_path)
+        cache_key = blake2b(f'{ffmpeg_path}|{binary_stat.st_size}|{binary_stat.st_mtime_ns}'.encode(), digest_size=16).hexdigest()
+        cache_filepath = f'{get_user_cache_directory()}/encoders/{cache_key}.json'
+    except OSError:
+        cache_filepath = None
+
+    if cache_filepath:
+        try:
+            with open(cache_filepath, encoding='utf-8') as cache_file:
+                cached_encoders = json_loads(cache_file.read())
+
+            if isinstance(cached_encoders, dict):
+                return cached_encoders
+        except (OSError, ValueError):
+            pass
+
+    try:
+        command_output = check_output([ffmpeg_path, '-hide_banner', '-encoders'], stderr=STDOUT, text=True, encoding='utf-8', errors='replace')
+    except (CalledProcessError, OSError):
+        return None
+
+    # Encoder lines look like ' V....D libx264 ...' with a six-character capability column; the legend rows carry '=' instead of a name
+    encoder_names = {parts[1]: parts[0][0] for line in command_output.splitlines() if len(parts := line.split()) >= 2 and len(parts[0]) == 6 and parts[0][0] in 'VAS' and parts[1] != '='}
+
+    if cache_filepath:
+        try:
+            cache_directory = dirname(cache_filepath)
+            makedirs(cache_directory, exist_ok=True)
+
+            with NamedTemporaryFile(mode='w', dir=cache_directory, suffix='.json', delete=False, encoding='utf-8') as temporary_cache_file:
+                temporary_cache_file.write(json_dumps(encoder_names))
+
+            replace(temporary_cache_file.name, cache_filepath)
+        except OSError:
+            pass
+
+    return encoder_names
+
+@lru_cache(maxsize=32)
+def _encoder_available(ffmpeg_path: str, codec: str, stream_type: str = None) -> bool:
+    """
+    Check whether the local FFmpeg installation provides an encoder, optionally matching its stream type
+    :param ffmpeg_path: Path to the FFmpeg binary
+    :param codec: Encoder name to check
+    :param stream_type: Expected stream type letter (V/A/S) or None to accept any
+    :return: True when the encoder is available
+    """
+
+    available_encoders = _get_ffmpeg_encoders(ffmpeg_path)
+
+    if available_encoders is not None:
+        encoder_type = available_encoders.get(codec)
+
+        return encoder_type is not None and (stream_type is None or encoder_type == stream_type)
+
+    # Fall back to one targeted query per codec when the encoder listing is unavailable
+    command_output = check_output([ffmpeg_path, '-hide_banner', '-h', f'encoder={codec}'], stderr=STDOUT, text=True, encoding='utf-8', errors='replace')
+
+    return not command_output.lstrip().startswith(f"Codec '{codec}' is not recognized")
+
+_gpu_acceleration_api_cache = False
+
+def get_gpu_acceleration_api() -> Union[str, None]:
+    """
+    Get the best GPU acceleration API supported by the local FFmpeg installation, probing it only once per run
+    :return: GPU acceleration API name or None
+    """
+
+    global _gpu_acceleration_api_cache
+
+    if _gpu_acceleration_api_cache is False:
+        _gpu_acceleration_api_cache = None
+        ffmpeg_path = get_ffmpeg_path()
+
+        if ffmpeg_path:
+            try:
+                command_output = check_output([ffmpeg_path, '-hide_banner', '-hwaccels'], stderr=STDOUT, text=True, encoding='utf-8', errors='replace')
+            except (CalledProcessError, OSError):
+                return None
+
+            available_apis = set(command_output.split())
+
+            for api in ('cuda', 'vaapi', 'd3d11va', 'qsv', 'videotoolbox', 'opencl'):
+                if api in available_apis:
+                    _gpu_acceleration_api_cache = api
+                    break
+
+    return _gpu_acceleration_api_cache
+
+def write_stdout(*lines: str) -> None:
+    """
+    Write multiple lines to stdout through its buffer without building a joined string
+    :param lines: Lines to write
+    """
+
+    stdout.writelines(f'{line}\n' for line in lines)
+    stdout.flush()
+
+def _cgroup_cpu_quota() -> Union[int, None]:
+    """
+    Read the cgroup v2 CPU quota for this process, rounding the allowed CPU share up to whole cores
+    :return: Number of cores granted by the quota or None when unlimited or unavailable
+    """
+
+    try:
+        with open('/sys/fs/cgroup/cpu.max', encoding='utf-8') as cpu_max_file:
+            quota, _, period = cpu_max_file.read().partition(' ')
+
+        if quota == 'max':
+            return None
+
+        return max(1, -(-int(quota) // int(period)))
+    except (OSError, ValueError):
+        return None
+
+@lru_cache(maxsize=1)
+def available_cpu_count() -> int:
+    """
+    Count the CPU cores actually available to this process, honoring affinity masks and cgroup CPU quotas where the platform exposes them
+    :return: Number of available CPU cores (at least 1)
+    """
+
+    try:
+        from os import sched_getaffinity
+        core_count = len(sched_getaffinity(0)) or 1
+    except (ImportError, OSError):
+        core_count = cpu_count() or 1
+
+    cgroup_quota = _cgroup_cpu_quota()
+
+    return min(core_count, cgroup_quota) if cgroup_quota else core_count
 
 def printdebug_class_items(class_instance: object) -> None:
     """
@@ -16,7 +199,7 @@ def printdebug_class_items(class_instance: object) -> None:
     :return:
     """
 
-    print('\n'.join([f'{key}={value}' for key, value in class_instance.__dict__.items()]))
+    write_stdout(*(f'{key}={value}' for key, value in class_instance.__dict__.items()))
 
 def exit_app(exit_code: int = None) -> None:
     """
@@ -28,33 +211,81 @@ def exit_app(exit_code: int = None) -> None:
 
 def open_github_repository() -> None:
     """
-    Open GitHub repository in the default web browser
+    Open GitHub repository in the default web browser without waiting for the browser helper
     """
 
-    open_browser_new_tab(AppInfo.source_code_url)
+    from sys import platform
+    from subprocess import DEVNULL
+
+    # Fire-and-forget on POSIX, where webbrowser blocks while xdg-open/open spawn the browser
+    if platform == 'darwin':
+        Popen(['open', AppInfo.source_code_url], start_new_session=True, stdout=DEVNULL, stderr=DEVNULL)
+    elif platform.startswith('linux') and which('xdg-open'):
+        Popen(['xdg-open', AppInfo.source_code_url], start_new_session=True, stdout=DEVNULL, stderr=DEVNULL)
+    else:
+        from webbrowser import open_new_tab as open_browser_new_tab
 
-def append_to_list(raw_list: list, prefix: Any = None, value: Any = None, ignore_if_not_value: bool = False) -> list:
+        open_browser_new_tab(AppInfo.source_code_url)
+
+@lru_cache(maxsize=1)
+def _find_mediainfo_library() -> Union[str, None]:
     """
-    Append a prefix and a value to a list if the value is not None
-    :param raw_list: Source list
-    :param prefix: Prefix to append before the value
-    :param value: Value to append after the prefix
-    :param ignore_if_not_value: Ignore the value if it is None
-    :return: Updated list
+    Locate the libmediainfo shared library once so pymediainfo skips its per-parse search
+    :return: Path to the libmediainfo shared library or None
+    """
+
+    from ctypes.util import find_library
+
+    return find_library('mediainfo')
+
+def get_user_cache_directory() -> str:
+    """
+    Get the transcodash cache directory inside the platform user cache location
+    :return: Cache directory path
+    """
+
+    base_directory = environ.get('XDG_CACHE_HOME') or f'{Path.home().as_posix()}/.cache'
+
+    return f'{base_directory}/transcodash'
+
+def _media_info_cache_filepath(path_to_file: Any) -> Union[str, None]:
     """
+    Build the media information cache file path keyed by the input file identity (path, size, and mtime)
+    :param path_to_file: Path to the input file
+    :return: Cache file path or None when the input file cannot be statted
+    """
+
+    try:
+        file_stat = stat(path_to_file)
+    except OSError:
+        return None
+
+    cache_key = blake2b(f'{path_to_file}|{file_stat.st_size}|{file_stat.st_mtime_ns}'.encode(), digest_size=16).hexdigest()
 
-    if isinstance(value, bool):
-        return raw_list
+    return f'{get_user_cache_directory()}/mediainfo/{cache_key}.json'
+
+def prune_media_info_cache(max_age_days: int = 30) -> None:
+    """
+    Remove media information cache entries that have not been written for the given number of days
+    :param max_age_days: Maximum cache entry age in days
+    """
 
-    if ignore_if_not_value and value is None:
-        return raw_list
+    cutoff_timestamp = time() - max_age_days * 86400
 
-    if prefix is not None:
-        raw_list.append(str(prefix))
-    if value is not None:
-        raw_list.append(str(value))
+    try:
+        cache_entries = scandir(f'{get_user_cache_directory()}/mediainfo')
+    except OSError:
+        return
+
+    with cache_entries:
+        for cache_entry in cache_entries:
+            try:
+                if cache_entry.is_file() and cache_entry.stat().st_mtime < cutoff_timestamp:
+                    remove(cache_entry.path)
+            except OSError:
+                pass
 
-    return raw_list
+_TRACK_TYPE_BUCKETS = {'Video': 'video', 'Audio': 'audio', 'Text': 'subtitle'}
 
 def retrieve_media_info(path_to_file: Any) -> Union[dict, None]:
     """
@@ -63,28 +294,47 @@ def retrieve_media_info(path_to_file: Any) -> Union[dict, None]:
     :return: Media information dictionary or None
     """
 
+    cache_filepath = _media_info_cache_filepath(path_to_file)
+
+    if cache_filepath:
+        try:
+            with open(cache_filepath, encoding='utf-8') as cache_file:
+                return json_loads(cache_file.read())
+        except (OSError, ValueError):
+            pass
+
+    from pymediainfo import MediaInfo
+
     try:
-        media_info = MediaInfo.parse(path_to_file)
-        media_info_data = {'video': list(), 'audio': list(), 'subtitle': list(), 'metadata': list()}
-
-        for track in media_info.tracks:
-            track_info = dict()
-            for key, value in track.__dict__.items():
-                if key != '_mediainfo':
-                    track_info[key] = value
-            if track.track_type == 'Video':
-                media_info_data['video'].append(track_info)
-            elif track.track_type == 'Audio':
-                media_info_data['audio'].append(track_info)
-            elif track.track_type == 'Text':
-                media_info_data['subtitle'].append(track_info)
-            else:
-                media_info_data['metadata'].append(track_info)
+        library_file = _find_mediainfo_library()
+        parse_options = {'output': 'JSON', 'full': False, 'parse_speed': 0.25}
+
+        if library_file:
+            parse_options['library_file'] = library_file
+
+        raw_media_info = MediaInfo.parse(path_to_file, **parse_options)
+        tracks = json_loads(raw_media_info).get('media') or {}
+        media_info_data = {'video': [], 'audio': [], 'subtitle': [], 'metadata': []}
+
+        for track_info in tracks.get('track') or []:
+            media_info_data[_TRACK_TYPE_BUCKETS.get(track_info.get('@type'), 'metadata')].append(track_info)
+
+        if cache_filepath:
+            try:
+                cache_directory = dirname(cache_filepath)
+                makedirs(cache_directory, exist_ok=True)
+
+                with NamedTemporaryFile(mode='w', dir=cache_directory, suffix='.json', delete=False, encoding='utf-8') as temporary_cache_file:
+                    temporary_cache_file.write(json_dumps(media_info_data))
+
+                replace(temporary_cache_file.name, cache_filepath)
+            except OSError:
+                pass
 
         return media_info_data
-    except BaseException as e:
-        print(f'[error] Failed to retrieve media information from the input file: {path_to_file.as_posix()} - Internal error: {e}')
-        exit_app()
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f'[error] Failed to retrieve media information from the input file: {path_to_file} - Internal error: {e}')
+        return None
 
 def validate_arguments(args: Namespace) -> Namespace:
     """
@@ -93,61 +343,249 @@ def validate_arguments(args: Namespace) -> Namespace:
     """
 
     # Checking required arguments
-    input_filepath = Path(args.input_filepath).resolve()
+    extensions = args.input_extensions
+    input_filepaths = []
 
-    if not input_filepath.is_file():
-        print(f'[error] Input file path argument is invalid: {input_filepath.as_posix()}')
-        exit_app()
+    for raw_input_filepath in args.input_filepaths:
+        input_filepath = realpath(raw_input_filepath)
 
-    output_filepath = Path(args.output_filepath).resolve()
+        if sep != '/':
+            input_filepath = input_filepath.replace(sep, '/')
 
-    if input_filepath == output_filepath:
-        print(f'[error] Output file path cannot be the same as input file path: {output_filepath.as_posix()}')
-        exit_app()
+        try:
+            input_stat = stat(input_filepath)
+        except OSError:
+            input_stat = None
+
+        if input_stat and S_ISDIR(input_stat.st_mode):
+            found_filepaths = scan_directory_files(input_filepath, extensions)
+
+            if not found_filepaths:
+                print(f'[error] No matching input files found in directory: {input_filepath}')
+                exit_app()
+
+            input_filepaths.extend(found_filepaths)
+        elif input_stat and S_ISREG(input_stat.st_mode):
+            input_filepaths.append(input_filepath)
+        elif any(character in raw_input_filepath for character in '*?['):
+            matched_filepaths = sorted(matched_filepath if sep == '/' else matched_filepath.replace(sep, '/') for matched_filepath in map(realpath, glob(raw_input_filepath, recursive=True)) if isfile(matched_filepath))
+
+            if not matched_filepaths:
+                print(f'[error] No input files matched the glob pattern: {raw_input_filepath}')
+                exit_app()
+
+            input_filepaths.extend(matched_filepaths)
+        else:
+            print(f'[error] Input file path argument is invalid: {input_filepath}')
+            exit_app()
 
-    args.input_filepath = input_filepath.as_posix()
+    # The output usually does not exist yet, so a plain string normalization is enough here;
+    # the stat-based same-file check below still follows symlinks when the output does exist
+    output_filepath = abspath(args.output_filepath)
 
-    if output_filepath.is_dir() or (output_filepath.parent == input_filepath.parent and output_filepath.exists() and not output_filepath.is_file()):
-        print(f'[error] Output file path argument is invalid: {output_filepath.as_posix()}')
-        exit_app()
+    if sep != '/':
+        output_filepath = output_filepath.replace(sep, '/')
+
+    try:
+        output_stat = stat(output_filepath)
+    except OSError:
+        output_stat = None
+
+    if len(input_filepaths) > 1 and not args.concat:
+        if output_stat and not S_ISDIR(output_stat.st_mode):
+            print(f'[error] Output path must be a directory when multiple input files are given: {output_filepath}')
+            exit_app()
+
+        makedirs(output_filepath, exist_ok=True)
+        output_filepaths = [f'{output_filepath}/{basename(input_filepath)}' for input_filepath in input_filepaths]
+    else:
+        if output_stat and not S_ISREG(output_stat.st_mode):
+            print(f'[error] Output file path argument is invalid: {output_filepath}')
+            exit_app()
+
+        output_filepaths = [output_filepath]
 
-    args.output_filepath = output_filepath.as_posix()
+    for input_filepath, output_filepath in zip(input_filepaths, output_filepaths):
+        if input_filepath == output_filepath:
+            print(f'[error] Output file path cannot be the same as input file path: {output_filepath}')
+            exit_app()
+
+        try:
+            output_stat = stat(output_filepath)
+        except OSError:
+            continue
+
+        input_stat = stat(input_filepath)
+
+        if (input_stat.st_dev, input_stat.st_ino) == (output_stat.st_dev, output_stat.st_ino):
+            print(f'[error] Output file path cannot be the same as input file path: {output_filepath}')
+            exit_app()
+
+    args.input_filepaths = input_filepaths
+    args.output_filepaths = output_filepaths
+
+    # Checking parallel job arguments
+    if not args.jobs or args.jobs < 1:
+        args.jobs = max(1, available_cpu_count() // 4)
+
+    # Never reserve threads for jobs that cannot run: concat is a single FFmpeg invocation, and
+    # fewer input files than jobs would otherwise shrink the per-job thread budget for nothing
+    args.jobs = min(args.jobs, 1 if args.concat else len(input_filepaths))
+
+    if args.threads_per_job is not None and args.threads_per_job < 1:
+        args.threads_per_job = None
 
     # Checking optional arguments
     if not args.video_codec or not str(args.video_codec).strip(): args.video_codec = 'copy'
-    elif not args.audio_codec or not str(args.audio_codec).strip(): args.audio_codec = 'copy'
-    elif not args.subtitle_codec or not str(args.subtitle_codec).strip(): args.subtitle_codec = 'copy'
+    if not args.audio_codec or not str(args.audio_codec).strip(): args.audio_codec = 'copy'
+    if not args.subtitle_codec or not str(args.subtitle_codec).strip(): args.subtitle_codec = 'copy'
+
+    # Normalize blank filtergraph chains at the source so argv cleaning only has to drop empty items
+    if args.video_filters is not None and not args.video_filters.strip(): args.video_filters = None
+    if args.audio_filters is not None and not args.audio_filters.strip(): args.audio_filters = None
+
+    # The generated command is executed right away, so fail fast when FFmpeg itself is missing
+    ffmpeg_path = get_ffmpeg_path()
+
+    if not ffmpeg_path:
+        print('[error] FFmpeg binary was not found in your PATH')
+        exit_app()
 
     # so rodar caso algum codec não seja copy
-    if args.video_codec != 'copy' or args.audio_codec != 'copy' or args.subtitle_codec != 'copy':
-        command_output = None
+    for stream_label, stream_type, codec in (('video', 'V', args.video_codec), ('audio', 'A', args.audio_codec), ('subtitle', 'S', args.subtitle_codec)):
+        if codec == 'copy':
+            continue
+
+        common_codec_type = _COMMON_CODECS.get(codec)
+
+        if common_codec_type == stream_type:
+            continue
+
+        if common_codec_type is not None:
+            print(f'[error] Chosen {stream_label} codec does not produce {stream_label} streams: {codec}')
+            exit_app()
 
         try:
-            command_output = check_output(['ffmpeg', '-codecs'], stderr=STDOUT).decode()
+            encoder_available = _encoder_available(ffmpeg_path, codec, stream_type)
         except CalledProcessError as e:
-            print(f'[error] Failed to check available FFmpeg codecs: {e} - Internal error: {e.output.decode()}')
+            print(f'[error] Failed to check available FFmpeg codecs: {e} - Internal error: {e.output}')
             exit_app()
 
-        if args.video_codec != 'copy' and args.video_codec not in command_output:
-            print(f'[error] Chosen video codec is not available in your local FFmpeg installation: {args.video_codec}')
-            exit_app()
-        elif args.audio_codec != 'copy' and args.audio_codec not in command_output:
-            print(f'[error] Chosen audio codec is not available in your local FFmpeg installation: {args.audio_codec}')
-            exit_app()
-        elif args.subtitle_codec != 'copy' and args.subtitle_codec not in command_output:
-            print(f'[error] Chosen subtitle codec is not available in your local FFmpeg installation: {args.subtitle_codec}')
+        if not encoder_available:
+            print(f'[error] Chosen {stream_label} codec is not available in your local FFmpeg installation: {codec}')
             exit_app()
 
     return args
 
+def parse_extension_set(raw_extensions: str) -> Union[frozenset, None]:
+    """
+    Parse a comma-separated extension list into a frozenset of lowercase extensions without dots
+    :param raw_extensions: Raw comma-separated extensions string
+    :return: Frozenset of normalized extensions or None
+    """
+
+    return frozenset(extension.strip().lower().lstrip('.') for extension in raw_extensions.split(',') if extension.strip()) or None
+
+def extract_total_duration(media_info_raw_data: dict) -> Union[float, None]:
+    """
+    Extract the total media duration in milliseconds from the raw media information
+    :param media_info_raw_data: Raw media information data
+    :return: Total duration in milliseconds or None
+    """
+
+    for track_info in media_info_raw_data['metadata'] + media_info_raw_data['video'] + media_info_raw_data['audio']:
+        duration = track_info.get('Duration')
+
+        if duration:
+            try:
+                return float(duration) * 1000
+            except (TypeError, ValueError):
+                continue
+
+    return None
+
+def scan_directory_files(directory_path: Path, extensions: frozenset = None) -> list:
+    """
+    Scan a directory for input files using os.scandir and an optional extension set
+    :param directory_path: Path to the directory to scan
+    :param extensions: Set of lowercase file extensions (without dots) to include, or None for all files
+    :return: Sorted list of matching absolute file path strings
+    """
+
+    with scandir(directory_path) as entries:
+        return sorted((entry.path if sep == '/' else entry.path.replace(sep, '/')) for entry in entries if entry.is_file() and (not extensions or entry.name.rpartition('.')[2].lower() in extensions))
+
+def find_available_filepath(filepath: str) -> str:
+    """
+    Find an available output file path by appending a formatted counter, reserving it atomically
+    :param filepath: Desired output file path
+    :return: Reserved available file path
+    """
+
+    path = Path(filepath)
+    index = 0
+
+    while True:
+        candidate = path if index == 0 else path.with_stem(f'{path.stem}_{index}')
+
+        try:
+            with open(candidate, 'x'):
+                pass
+
+            return candidate.as_posix()
+        except FileExistsError:
+            index += 1
+
+def is_output_up_to_date(input_filepath: str, output_filepath: str) -> bool:
+    """
+    Check whether the output file already exists, is not empty, and is newer than the input file
+    :param input_filepath: Path to the input file
+    :param output_filepath: Path to the output file
+    :return: True when the output file is already up to date
+    """
+
+    try:
+        output_stat = stat(output_filepath)
+        input_stat = stat(input_filepath)
+    except OSError:
+        return False
+
+    return output_stat.st_size > 0 and output_stat.st_mtime >= input_stat.st_mtime
+
+def run_ffmpeg_command(cli_args: list, total_duration_ms: float = None) -> int:
+    """
+    Run the generated FFmpeg command as an argument list, without a shell, streaming its progress
+    :param cli_args: FFmpeg CLI arguments (the first item is the FFmpeg binary path)
+    :param total_duration_ms: Total input duration in milliseconds, used to print progress percentages
+    :return: FFmpeg process exit code
+    """
+
+    cli_args = [cli_args[0], '-progress', 'pipe:1', '-nostats'] + cli_args[1:]
+    process = Popen(cli_args, shell=False, stdout=PIPE, bufsize=1, text=True)
+
+    for line in process.stdout:
+        key, _, value = line.strip().partition('=')
+
+        if key == 'out_time_ms' and total_duration_ms:
+            try:
+                progress_percentage = min(100.0, int(value) / 1000 / total_duration_ms * 100)
+            except ValueError:
+                continue
+
+            print(f'\r[info] Transcoding progress: {progress_percentage:.1f}%', end='', flush=True)
+        elif key == 'progress' and value == 'end':
+            print('\r[info] Transcoding progress: 100.0%', flush=True)
+
+    return process.wait()
+
 def clean_list_items(raw_list: list) -> list:
     """
-    Clean a list by removing None, empty, and whitespace items
+    Clean a list by removing None and empty items
     :param raw_list: Source list
     :return: Cleaned list
     """
 
-    return [item for item in raw_list if item is not None and item.strip()]
+    return [item for item in raw_list if item]
 
 class AppInfo:
     name = 'Transcodash'
@@ -160,106 +598,120 @@ class FFmpegGeneralSettings:
     gpu_acceleration_api = None
     gpu_acceleration_device_index = None
     threads = None
+    probe_size = None
+    analyze_duration = None
+    generate_pts = None
     overwrite_existing_files = None
     hide_banner = None
-    show_extra_debug_info = None
 
-    def calculate_best_parameters(self) -> None:
+    def calculate_best_parameters(self, max_threads: int = None, gpu_mode: str = 'auto', deep_probe: bool = False) -> None:
         """
         Calculate the best FFmpeg settings based on the available system resources
+        :param max_threads: Maximum number of threads to use (None for automatic)
+        :param gpu_mode: GPU acceleration mode ('auto', 'off', or an explicit API name)
+        :param deep_probe: Use FFmpeg's full input analysis instead of the fast-start probing flags
         """
 
-        def set_ffmpeg_path() -> None:
-            """
-            Set absolute path to FFmpeg binary file if available
-            """
+        self._set_ffmpeg_path()
+        self._set_gpu_acceleration_api_and_device_index(gpu_mode)
+        self._set_threads(max_threads)
+        self._set_other_settings(deep_probe)
 
-            _ffmpeg_path = which('ffmpeg')
-
-            if not _ffmpeg_path:
-                self.ffmpeg_path = None
+    def _set_ffmpeg_path(self) -> None:
+        """
+        Set absolute path to FFmpeg binary file if available
+        """
 
-            self.ffmpeg_path = Path(_ffmpeg_path).resolve().as_posix()
+        self.ffmpeg_path = get_ffmpeg_path()
 
-        def set_gpu_acceleration_api_and_device_index() -> None:
-            """
-            Set ideal GPU acceleration API and device index if available
-            """
+    def _set_gpu_acceleration_api_and_device_index(self, gpu_mode: str) -> None:
+        """
+        Set ideal GPU acceleration API and device index if available
+        :param gpu_mode: GPU acceleration mode ('auto', 'off', or an explicit API name)
+        """
 
-            # Feature unavailable at the moment. (Please ignore this function)
+        if gpu_mode == 'off':
             self.gpu_acceleration_api = None
             self.gpu_acceleration_device_index = None
             return
-            # ...
-
-            _gpu_acceleration_api = None
-            _gpu_acceleration_device_index = None
-
-            if which('nvidia-smi'):
-                _gpu_acceleration_api = 'cuda'
-            elif which('vainfo'):
-                _gpu_acceleration_api = 'vaapi'
-            elif which('dxva2'):
-                _gpu_acceleration_api = 'd3d11va'
-            elif which('clinfo'):
-                _gpu_acceleration_api = 'opencl'
-            else:
-                self.gpu_acceleration_api = _gpu_acceleration_api
-                self.gpu_acceleration_device_index = _gpu_acceleration_device_index
-
-            if _gpu_acceleration_api:
-                self.gpu_acceleration_api = _gpu_acceleration_api
-                self.gpu_acceleration_device_index = 0
-
-        def set_threads() -> None:
-            """
-            Set ideal number of threads to use
-            """
 
-            _threads = cpu_count()
+        if gpu_mode == 'auto':
+            # -hwaccels only reports APIs compiled into the build, not APIs with a usable device, so
+            # committing to one (e.g. cuda without NVIDIA hardware) would abort the whole transcode.
+            # The literal 'auto' lets FFmpeg pick a working device and fall back to software decoding.
+            self.gpu_acceleration_api = 'auto' if get_gpu_acceleration_api() else None
+            self.gpu_acceleration_device_index = None
+            return
 
-            if not _threads or _threads <= 1:
-                self.threads = None
-            else:
-                self.threads = _threads - 1
+        self.gpu_acceleration_api = gpu_mode
+        self.gpu_acceleration_device_index = 0
 
-        def set_other_settings() -> None:
-            """
-            Set default values for other FFmpeg settings
-            """
+    def _set_threads(self, max_threads: int = None) -> None:
+        """
+        Set ideal number of threads to use
+        :param max_threads: Maximum number of threads to use (None for automatic)
+        """
 
-            # Overwrite existing files
-            self.overwrite_existing_files = True
+        _threads = available_cpu_count()
 
-            # Hide FFmpeg banner
-            self.hide_banner = True
+        if not _threads or _threads <= 1:
+            self.threads = None
+        else:
+            self.threads = _threads - 1
 
-            # Show extra FFmpeg debug info
-            self.show_extra_debug_info = True
+        if max_threads is not None:
+            self.threads = max(1, min(self.threads or max_threads, max_threads))
 
-        set_ffmpeg_path()
-        set_gpu_acceleration_api_and_device_index()
-        set_threads()
-        set_other_settings()
+    def _set_other_settings(self, deep_probe: bool = False) -> None:
+        """
+        Set default values for other FFmpeg settings
+        :param deep_probe: Use FFmpeg's full input analysis instead of the fast-start probing flags
+        """
 
-    def generate_cli_args(self) -> list:
+        # Fast-start input probing flags
+        self.probe_size = None if deep_probe else 32
+        self.analyze_duration = None if deep_probe else 0
+        self.generate_pts = None if deep_probe else '+genpts'
+
+        # Overwrite existing files
+        self.overwrite_existing_files = True
+
+        # Hide FFmpeg banner
+        self.hide_banner = True
+
+    # Flags taking the setting value, in argv order
+    _ARG_SPEC = (
+        ('-hwaccel', 'gpu_acceleration_api'),
+        ('-hwaccel_device', 'gpu_acceleration_device_index'),
+        ('-threads', 'threads'),
+        ('-probesize', 'probe_size'),
+        ('-analyzeduration', 'analyze_duration'),
+        ('-fflags', 'generate_pts'),
+    )
+
+    # Boolean flags emitted when the setting is truthy
+    _FLAG_SPEC = (
+        ('-y', 'overwrite_existing_files'),
+        ('-hide_banner', 'hide_banner'),
+    )
+
+    def generate_cli_args(self) -> tuple:
         """
         Generate FFmpeg CLI arguments based on the best available settings
-        :return: Updated list
+        :return: Generated arguments tuple
         """
 
-        generated_args = list()
-        append_to_list(generated_args, value=self.ffmpeg_path)
-        append_to_list(generated_args, prefix='-hwaccel', value=self.gpu_acceleration_api, ignore_if_not_value=True)
-        append_to_list(generated_args, prefix='-hwaccel_device', value=self.gpu_acceleration_device_index, ignore_if_not_value=True)
-        append_to_list(generated_args, prefix='-threads', value=self.threads, ignore_if_not_value=True)
-        append_to_list(generated_args, value='-y' if self.overwrite_existing_files else None)
-        append_to_list(generated_args, value='-hide_banner' if self.hide_banner else None)
-        append_to_list(generated_args, value='-stats' if self.show_extra_debug_info else None)
+        generated_args = [self.ffmpeg_path]
+        generated_args += (piece for flag, setting_name in self._ARG_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, str(value)))
+        generated_args += (flag for flag, setting_name in self._FLAG_SPEC if getattr(self, setting_name))
 
-        return generated_args
+        return tuple(generated_args)
+
+_render_cli_args_cache: dict = {}
 
 class FFmpegRenderSettings:
+    __slots__ = ('video_section', 'audio_section', 'subtitle_arguments', 'metadata_arguments', 'custom_arguments')
+
     def __init__(self):
         self.video_section = self.VideoSection()
         self.audio_section = self.AudioSection()
@@ -267,21 +719,48 @@ class FFmpegRenderSettings:
         self.metadata_arguments = self.MetadataArguments()
         self.custom_arguments = self.CustomArguments()
 
-    def generate_cli_args(self) -> list:
+    def calculate_best_parameters(self, media_info: 'MediaInfoData', threads: int = None) -> None:
         """
-        Generate FFmpeg CLI arguments based on the best available settings
-        :return: Updated list
+        Calculate the best render parameters for all sections in a single pass over the media information
+        :param media_info: MediaInfoData object
+        :param threads: Number of FFmpeg threads available for this job
+        """
+
+        self.video_section.arguments.calculate_best_parameters(media_info, threads=threads)
+        self.video_section.filters.calculate_best_parameters(media_info)
+        self.audio_section.arguments.calculate_best_parameters(media_info)
+        self.audio_section.filters.calculate_best_parameters(media_info)
+        self.subtitle_arguments.calculate_best_parameters(media_info)
+        self.metadata_arguments.calculate_best_parameters(media_info)
+
+    def settings_snapshot(self) -> tuple:
+        """
+        Build a hashable snapshot of every section setting that affects the generated CLI arguments
+        :return: Tuple of (setting name, value) pairs across all sections
+        """
+
+        sections = (self.video_section.arguments, self.video_section.filters, self.audio_section.arguments, self.audio_section.filters, self.subtitle_arguments, self.metadata_arguments, self.custom_arguments)
+
+        return tuple((section_field.name, getattr(section, section_field.name)) for section in sections for section_field in fields(section))
+
+    def generate_cli_args(self) -> tuple:
         """
+        Generate FFmpeg CLI arguments based on the best available settings, reusing the argv built for an identical settings snapshot
+        :return: Generated arguments tuple
+        """
+
+        settings_snapshot = self.settings_snapshot()
+        generated_args = _render_cli_args_cache.get(settings_snapshot)
 
-        generated_args = self.video_section.generate_cli_args()
-        generated_args += self.audio_section.generate_cli_args()
-        generated_args += self.subtitle_arguments.generate_cli_args()
-        generated_args += self.metadata_arguments.generate_cli_args()
-        generated_args += self.custom_arguments.generate_cli_args()
+        if generated_args is None:
+            generated_args = self.video_section.generate_cli_args() + self.audio_section.generate_cli_args() + self.subtitle_arguments.generate_cli_args() + self.metadata_arguments.generate_cli_args() + self.custom_arguments.generate_cli_args()
+            _render_cli_args_cache[settings_snapshot] = generated_args
 
         return generated_args
 
     class VideoSection:
+        __slots__ = ('arguments', 'filters')
+
         def __init__(self):
             """
             Initialize the video section with the best available settings
@@ -290,65 +769,104 @@ class FFmpegRenderSettings:
             self.arguments = self.Arguments()
             self.filters = self.Filters()
 
-        def generate_cli_args(self) -> list:
+        def generate_cli_args(self) -> tuple:
             """
             Generate FFmpeg CLI arguments based on the best available settings
-            :return: Updated list
+            :return: Generated arguments tuple
             """
 
-            generated_args = self.arguments.generate_cli_args()
-            generated_args += self.filters.generate_cli_args()
-
-            return generated_args
+            return self.arguments.generate_cli_args() + self.filters.generate_cli_args()
 
+        @dataclass(slots=True)
         class Arguments:
-            codec = None  # Video codec: libsvtav1 (-c:v)
-            frame_rate = None  # Video frame rate: None [30, 60, 120, ...] (-framerate)
-            bit_rate = None  # Video bit rate: 0 [1m, 2m, 3m, ...] (-b:v)
-            min_rate = None  # Minimum video bit rate: 1m [1m, 2m, 3m, ...] (-minrate:v)
-            max_rate = None  # Maximum video bit rate: 6m [1m, 2m, 3m, ...] (-maxrate:v)
-            quality = None  # Quality preset: high [high, medium, low, ...] (-quality)
-            level = None  # Level: 4.0 [1.0, 2.0, 3.0, 4.0, 5.0, ...] (-level)
-            tile_columns = None  # Tip: tile_columns * tile_rows = YOUR_CPU_CORES [0, 1, 2, 3, ...] (-tile_columns)
-            tile_rows = None  # Tip: tile_rows * tile_columns = YOUR_CPU_CORES [0, 1, 2, 3, ...] (-tile_rows)
-            profile = None  # Video profile: main [main, high, ...] (-profile:v)
-            prediction = None  # Prediction mode: complex [simple, complex, ...] (-pred)
-            b_frames_strategy = None  # B-frames strategy: 1 [0, 1, 2, 3, ...] (-b_strategy)
-            b_frames = None  # Number of B-frames: 0 [1, 2, 3, ...] (-bf)
-            pixel_format = None  # Pixel format: yuv420p [yuv420p, yuv422p, yuv444p, ...] (-pix_fmt)
-
-            def calculate_best_parameters(self, media_info: 'MediaInfoData') -> None:
+            codec: Union[str, None] = None  # Video codec: libsvtav1 (-c:v)
+            frame_rate: Union[int, None] = None  # Video frame rate: None [30, 60, 120, ...] (-framerate)
+            bit_rate: Union[str, None] = None  # Video bit rate: 0 [1m, 2m, 3m, ...] (-b:v)
+            min_rate: Union[str, None] = None  # Minimum video bit rate: 1m [1m, 2m, 3m, ...] (-minrate:v)
+            max_rate: Union[str, None] = None  # Maximum video bit rate: 6m [1m, 2m, 3m, ...] (-maxrate:v)
+            quality: Union[str, None] = None  # Quality preset: high [high, medium, low, ...] (-quality)
+            level: Union[float, None] = None  # Level: 4.0 [1.0, 2.0, 3.0, 4.0, 5.0, ...] (-level)
+            tile_columns: Union[int, None] = None  # Tip: tile_columns * tile_rows = YOUR_CPU_CORES [0, 1, 2, 3, ...] (-tile_columns)
+            tile_rows: Union[int, None] = None  # Tip: tile_rows * tile_columns = YOUR_CPU_CORES [0, 1, 2, 3, ...] (-tile_rows)
+            profile: Union[str, None] = None  # Video profile: main [main, high, ...] (-profile:v)
+            prediction: Union[str, None] = None  # Prediction mode: complex [simple, complex, ...] (-pred)
+            b_frames_strategy: Union[int, None] = None  # B-frames strategy: 1 [0, 1, 2, 3, ...] (-b_strategy)
+            b_frames: Union[int, None] = None  # Number of B-frames: 0 [1, 2, 3, ...] (-bf)
+            pixel_format: Union[str, None] = None  # Pixel format: yuv420p [yuv420p, yuv422p, yuv444p, ...] (-pix_fmt)
+
+            def calculate_best_parameters(self, media_info: 'MediaInfoData', threads: int = None) -> None:
                 """
                 Calculate the best video parameters based on the input media file
                 :param media_info: MediaInfoData object
+                :param threads: Number of FFmpeg threads available for this job
                 """
 
-                def set_video_codec() -> None:
-                    """
-                    Set the best video codec based on the input media file
-                    """
+                self._set_video_codec(media_info)
+                self._set_tile_layout(threads)
 
-                    pass
+            def _set_video_codec(self, media_info: 'MediaInfoData') -> None:
+                """
+                Set the best video codec based on the input media file
+                :param media_info: MediaInfoData object
+                """
 
-                # Run all video settings calculations
-                set_video_codec()
+                pass
 
-            def generate_cli_args(self) -> list:
+            def _set_tile_layout(self, threads: int = None) -> None:
                 """
-                Generate FFmpeg CLI arguments based on the best available settings
-                :return: Updated list
+                Set the tile layout so that the tile count approximates the available threads
+                :param threads: Number of FFmpeg threads available for this job
                 """
 
-                generated_args = list()
+                # -tile_columns/-tile_rows take log2 values and only exist on the libsvtav1 encoder
+                if self.codec != 'libsvtav1' or not threads or threads <= 1:
+                    return
+
+                columns_log2, rows_log2 = 0, 0
+
+                while (1 << (columns_log2 + rows_log2 + 1)) <= threads:
+                    if columns_log2 <= rows_log2:
+                        columns_log2 += 1
+                    else:
+                        rows_log2 += 1
+
+                self.tile_columns = columns_log2
+                self.tile_rows = rows_log2
+
+            # Flags taking the setting value, in argv order
+            _ARG_SPEC = (
+                ('-c:v', 'codec'),
+                ('-framerate', 'frame_rate'),
+                ('-b:v', 'bit_rate'),
+                ('-minrate:v', 'min_rate'),
+                ('-maxrate:v', 'max_rate'),
+                ('-quality', 'quality'),
+                ('-level', 'level'),
+                ('-tile_columns', 'tile_columns'),
+                ('-tile_rows', 'tile_rows'),
+                ('-profile:v', 'profile'),
+                ('-pred', 'prediction'),
+                ('-b_strategy', 'b_frames_strategy'),
+                ('-bf', 'b_frames'),
+                ('-pix_fmt', 'pixel_format'),
+            )
+
+            def generate_cli_args(self) -> tuple:
+                """
+                Generate FFmpeg CLI arguments based on the best available settings
+                :return: Generated arguments tuple
+                """
 
-                return generated_args
+                return tuple(piece for flag, setting_name in self._ARG_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, str(value)))
 
+        @dataclass(slots=True)
         class Filters:
-            tune = None  # Tune: None [animation, film, grain, ...] (-tune)
-            noise_reduction = None  # Noise reduction: None [0.1, 0.2, 0.3, ...] (-noise_reduction)
-            deblock = None  # Deblocking: None [0.1, 0.2, 0.3, ...] (-deblock)
-            sharpness = None  # Sharpness: None [0.1, 0.2, 0.3, ...] (-sharpness)
-            gamma = None  # Gamma: None [0.1, 0.2, 0.3, ...] (-gamma)
+            tune: Union[str, None] = None  # Tune: None [animation, film, grain, ...] (-tune)
+            noise_reduction: Union[float, None] = None  # Noise reduction: None [0.1, 0.2, 0.3, ...] (-noise_reduction)
+            deblock: Union[float, None] = None  # Deblocking: None [0.1, 0.2, 0.3, ...] (-deblock)
+            sharpness: Union[float, None] = None  # Sharpness: None [0.1, 0.2, 0.3, ...] (-sharpness)
+            gamma: Union[float, None] = None  # Gamma: None [0.1, 0.2, 0.3, ...] (-gamma)
+            custom_chain: Union[str, None] = None  # Custom video filtergraph chain: None [scale=1280:720,unsharp=5:5:1.0, ...] (-vf)
 
             def calculate_best_parameters(self, media_info: 'MediaInfoData') -> None:
                 """
@@ -358,17 +876,27 @@ class FFmpegRenderSettings:
 
                 pass
 
-            def generate_cli_args(self) -> list:
+            # Flags taking the setting value, in argv order
+            _ARG_SPEC = (
+                ('-tune', 'tune'),
+                ('-noise_reduction', 'noise_reduction'),
+                ('-deblock', 'deblock'),
+                ('-sharpness', 'sharpness'),
+                ('-gamma', 'gamma'),
+                ('-vf', 'custom_chain'),
+            )
+
+            def generate_cli_args(self) -> tuple:
                 """
                 Generate FFmpeg CLI arguments based on the best available settings
-                :return: Updated list
+                :return: Generated arguments tuple
                 """
 
-                generated_args = list()
-
-                return generated_args
+                return tuple(piece for flag, setting_name in self._ARG_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, str(value)))
 
     class AudioSection:
+        __slots__ = ('arguments', 'filters')
+
         def __init__(self):
             """
             Initialize the audio section with the best available settings
@@ -377,21 +905,19 @@ class FFmpegRenderSettings:
             self.arguments = self.Arguments()
             self.filters = self.Filters()
 
-        def generate_cli_args(self) -> list:
+        def generate_cli_args(self) -> tuple:
             """
             Generate FFmpeg CLI arguments based on the best available settings
-            :return: Updated list
+            :return: Generated arguments tuple
             """
 
-            generated_args = self.arguments.generate_cli_args()
-            generated_args += self.filters.generate_cli_args()
-
-            return generated_args
+            return self.arguments.generate_cli_args() + self.filters.generate_cli_args()
 
+        @dataclass(slots=True)
         class Arguments:
-            codec = None  # Audio codec: libopus (-c:a)
-            bit_rate = None  # Audio bit rate: 128k [64k, 128k, 256k, ...] (-b:a)
-            sample_rate = None  # Audio sample rate: 48000 [48000, 44100, 22050, ...] (-ar)
+            codec: Union[str, None] = None  # Audio codec: libopus (-c:a)
+            bit_rate: Union[str, None] = None  # Audio bit rate: 128k [64k, 128k, 256k, ...] (-b:a)
+            sample_rate: Union[int, None] = None  # Audio sample rate: 48000 [48000, 44100, 22050, ...] (-ar)
 
             def calculate_best_parameters(self, media_info: 'MediaInfoData') -> None:
                 """
@@ -399,27 +925,35 @@ class FFmpegRenderSettings:
                 :param media_info: MediaInfoData object
                 """
 
-                def set_audio_codec() -> None:
-                    """
-                    Set the best audio codec based on the input media file
-                    """
+                self._set_audio_codec(media_info)
 
-                    pass
+            def _set_audio_codec(self, media_info: 'MediaInfoData') -> None:
+                """
+                Set the best audio codec based on the input media file
+                :param media_info: MediaInfoData object
+                """
 
-                # Run all audio settings calculations
-                set_audio_codec()
+                pass
+
+            # Flags taking the setting value, in argv order
+            _ARG_SPEC = (
+                ('-c:a', 'codec'),
+                ('-b:a', 'bit_rate'),
+                ('-ar', 'sample_rate'),
+            )
 
-            def generate_cli_args(self) -> list:
+            def generate_cli_args(self) -> tuple:
                 """
                 Generate FFmpeg CLI arguments based on the best available settings
-                :return: Updated list
+                :return: Generated arguments tuple
                 """
 
-                generated_args = list()
-
-                return generated_args
+                return tuple(piece for flag, setting_name in self._ARG_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, str(value)))
 
+        @dataclass(slots=True)
         class Filters:
+            custom_chain: Union[str, None] = None  # Custom audio filtergraph chain: None [loudnorm=I=-16:TP=-1.5, ...] (-af)
+
             def calculate_best_parameters(self, media_info: 'MediaInfoData') -> None:
                 """
                 Calculate the best audio filters based on the input media file
@@ -428,18 +962,22 @@ class FFmpegRenderSettings:
 
                 pass
 
-            def generate_cli_args(self) -> list:
+            # Flags taking the setting value, in argv order
+            _ARG_SPEC = (
+                ('-af', 'custom_chain'),
+            )
+
+            def generate_cli_args(self) -> tuple:
                 """
                 Generate FFmpeg CLI arguments based on the best available settings
-                :return: Updated list
+                :return: Generated arguments tuple
                 """
 
-                generated_args = list()
-
-                return generated_args
+                return tuple(piece for flag, setting_name in self._ARG_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, str(value)))
 
+    @dataclass(slots=True)
     class SubtitleArguments:
-        codec = None  # Subtitle codec: webvtt (-c:s)
+        codec: Union[str, None] = None  # Subtitle codec: webvtt (-c:s)
 
         def calculate_best_parameters(self, media_info: 'MediaInfoData') -> None:
             """
@@ -447,40 +985,61 @@ class FFmpegRenderSettings:
             :param media_info: MediaInfoData object
             """
 
-            def set_subtitle_codec() -> None:
-                """
-                Set the best subtitle codec based on the input media file
-                """
+            self._set_subtitle_codec(media_info)
 
-                pass
+        def _set_subtitle_codec(self, media_info: 'MediaInfoData') -> None:
+            """
+            Set the best subtitle codec based on the input media file
+            :param media_info: MediaInfoData object
+            """
+
+            pass
 
-            # Run all subtitle settings calculations
-            set_subtitle_codec()
+        # Flags taking the setting value, in argv order
+        _ARG_SPEC = (
+            ('-c:s', 'codec'),
+        )
 
-        def generate_cli_args(self) -> list:
+        def generate_cli_args(self) -> tuple:
             """
             Generate FFmpeg CLI arguments based on the best available settings
-            :return: Updated list
+            :return: Generated arguments tuple
             """
 
-            generated_args = list()
-
-            return generated_args
-
-    class MetadataArguments:  # ---> !!! In this class, for each parameter, the value must be inside the braces "{}", to be replaced by the real value
-        metadata_title = None  # Media title (-metadata title="{}")
-        video_stream_title = None  # Video stream title (-metadata:s:v:0 title="{}")
-        audio_stream_title = None  # Audio stream title (-metadata:s:a:0 title="{}")
-        video_stream_language = None  # Video stream language (-metadata:s:v:0 language="{}")
-        audio_stream_language = None  # Audio stream language (-metadata:s:a:0 language="{}")
-        subtitle_stream_language = None  # Subtitle stream language (-metadata:s:s:0 language="{}")
-        media_artist = None  # Media artist (-metadata artist="{}")
-        media_year = None  # Media year (-metadata year="{}")
-        media_genre = None  # Media genre (-metadata genre="{}")
-        media_album = None  # Media album (-metadata album="{}")
-        media_album_artist = None  # Media album artist (-metadata album_artist="{}")
-        media_comment = None  # Media comment (-metadata comment="{}")
-        media_track_number = None  # Media track number (-metadata track="{}")
+            return tuple(piece for flag, setting_name in self._ARG_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, str(value)))
+
+    @dataclass(slots=True)
+    class MetadataArguments:
+        metadata_title: Union[str, None] = None  # Media title (-metadata title=...)
+        video_stream_title: Union[str, None] = None  # Video stream title (-metadata:s:v:0 title=...)
+        audio_stream_title: Union[str, None] = None  # Audio stream title (-metadata:s:a:0 title=...)
+        video_stream_language: Union[str, None] = None  # Video stream language (-metadata:s:v:0 language=...)
+        audio_stream_language: Union[str, None] = None  # Audio stream language (-metadata:s:a:0 language=...)
+        subtitle_stream_language: Union[str, None] = None  # Subtitle stream language (-metadata:s:s:0 language=...)
+        media_artist: Union[str, None] = None  # Media artist (-metadata artist=...)
+        media_year: Union[int, None] = None  # Media year (-metadata year=...)
+        media_genre: Union[str, None] = None  # Media genre (-metadata genre=...)
+        media_album: Union[str, None] = None  # Media album (-metadata album=...)
+        media_album_artist: Union[str, None] = None  # Media album artist (-metadata album_artist=...)
+        media_comment: Union[str, None] = None  # Media comment (-metadata comment=...)
+        media_track_number: Union[int, None] = None  # Media track number (-metadata track=...)
+
+        # Emission table: (setting name, FFmpeg flag, metadata key)
+        _META_SPEC = (
+            ('metadata_title', '-metadata', 'title'),
+            ('video_stream_title', '-metadata:s:v:0', 'title'),
+            ('audio_stream_title', '-metadata:s:a:0', 'title'),
+            ('video_stream_language', '-metadata:s:v:0', 'language'),
+            ('audio_stream_language', '-metadata:s:a:0', 'language'),
+            ('subtitle_stream_language', '-metadata:s:s:0', 'language'),
+            ('media_artist', '-metadata', 'artist'),
+            ('media_year', '-metadata', 'year'),
+            ('media_genre', '-metadata', 'genre'),
+            ('media_album', '-metadata', 'album'),
+            ('media_album_artist', '-metadata', 'album_artist'),
+            ('media_comment', '-metadata', 'comment'),
+            ('media_track_number', '-metadata', 'track'),
+        )
 
         def calculate_best_parameters(self, media_info: 'MediaInfoData') -> None:
             """
@@ -490,90 +1049,75 @@ class FFmpegRenderSettings:
 
             pass
 
-        def generate_cli_args(self) -> list:
+        def generate_cli_args(self) -> tuple:
             """
             Generate FFmpeg CLI arguments based on the best available settings
-            :return: Updated list
+            :return: Generated arguments tuple
             """
 
-            generated_args = list()
-
-            return generated_args
+            # No shell quoting around the values: argv entries reach FFmpeg verbatim
+            return tuple(piece for setting_name, flag, metadata_key in self._META_SPEC if (value := getattr(self, setting_name)) is not None for piece in (flag, f'{metadata_key}={value}'))
 
+    @dataclass(slots=True)
     class CustomArguments:
-        args = None  # Custom extra FFmpeg arguments
+        args: Union[tuple, None] = None  # Custom extra FFmpeg arguments
 
-        def generate_cli_args(self) -> list:
+        def generate_cli_args(self) -> tuple:
             """
             Generate FFmpeg CLI arguments based on the user-defined settings
-            :return: Updated list
+            :return: Generated arguments tuple
             """
 
-            generated_args = list()
-
-            return generated_args
+            return tuple(self.args) if self.args else ()
 
+@dataclass(frozen=True, slots=True)
 class RunOnFinish:
-    cmd = None  # Custom bash (depends on your OS) command to run on finish (this will be executed before power action)
-    delay = None  # Delay in seconds before power action and after custom command execution
-    task = None  # Power action available tasks: 'shutdown', 'restart', 'hibernate', 'sleep', 'lock', 'logout'
+    cmd: Union[str, None] = None  # Custom bash (depends on your OS) command to run on finish (this will be executed before power action)
+    delay: Union[int, None] = None  # Delay in seconds before power action and after custom command execution
+    task: Union[str, None] = None  # Power action available tasks: 'shutdown', 'restart', 'hibernate', 'sleep', 'lock', 'logout'
+
+# RunOnFinish is frozen, so the default (all-None) instance can be shared across all files
+_default_run_on_finish = RunOnFinish()
 
 class MediaInfoData:
     def __init__(self, data: dict) -> None:
         """
-        Initialize the MediaInfoData object with the raw data
+        Initialize the MediaInfoData object, materializing the wrapped data as plain instance attributes
         :param data: Raw media information data
         """
 
-        self._data = data
+        self.__dict__.update((key, self._wrap_value(value)) for key, value in data.items())
 
-    def __getattr__(self, attr: str) -> Union[Any, 'MediaInfoData', None]:
+    def __getattr__(self, attr: str) -> None:
         """
-        Get the value of an attribute from the raw data
+        Return None for attributes missing from the wrapped data (only invoked on lookup misses)
         :param attr: Attribute name
-        :return: Attribute value or None
+        :return: None
         """
 
-        if attr.startswith('_'):
-            return self.__dict__.get(attr)
-
-        value = self._data.get(attr)
-
-        if value is not None:
-            if isinstance(value, list):
-                if len(value) == 1:
-                    return self._wrap_value(value[0])
-
-                return [self._wrap_value(item) for item in value]
-
-            elif isinstance(value, dict):
-                return self._wrap_value(value)
-
-            return value
-
         return None
 
     def __getitem__(self, item: str) -> Any:
         """
-        Get the value of an item from the raw data
+        Get the value of an item from the wrapped data
         :param item: Item name
         :return: Item value
         """
 
-        return self._data.get(item)
+        return self.__dict__.get(item)
 
     def __repr__(self) -> str:
         """
-        Return the raw data representation
-        :return: Raw data representation
+        Return the wrapped data representation
+        :return: Wrapped data representation
         """
 
-        return repr(self._data)
+        return repr(self.__dict__)
 
-    @staticmethod
-    def _wrap_value(value: Any) -> Union[Any, 'MediaInfoData']:
+    @classmethod
+    def _wrap_value(cls, value: Any) -> Union[Any, 'MediaInfoData']:
         """
-        Wrap a value in a MediaInfoData object if it is a dictionary
+        Wrap dictionaries (and lists of dictionaries) in MediaInfoData objects
         :param value: Value to wrap
         :return: Wrapped value
         """
@@ -581,57 +1125,228 @@ class MediaInfoData:
         if isinstance(value, dict):
             return MediaInfoData(value)
 
+        if isinstance(value, list):
+            if len(value) == 1:
+                return cls._wrap_value(value[0])
+
+            return [cls._wrap_value(item) for item in value]
+
         return value
 
-def app(args: Namespace) -> None:
+def process_file(input_filepath: str, output_filepath: str, args: Namespace, general_cli_args: list, threads: int = None) -> None:
     """
-    Main application function
+    Process a single input file: analyze it and generate the FFmpeg command
+    :param input_filepath: Path to the input file
+    :param output_filepath: Path to the output file
     :param args: Parsed command line arguments
+    :param general_cli_args: Pre-generated general FFmpeg CLI arguments, shared across files
+    :param threads: Number of FFmpeg threads available for this job
     """
 
-    # Validate command line arguments
-    args = validate_arguments(args)
+    # Skip files whose output already exists and is newer than the input
+    if not args.force and is_output_up_to_date(input_filepath, output_filepath):
+        print(f'[info] Skipping already transcoded input file: {input_filepath}')
+        return
+
+    # Reserve a fresh output file path instead of replacing an existing one
+    if args.no_overwrite:
+        output_filepath = find_available_filepath(output_filepath)
+
+    # Stage the input file into the local scratch directory
+    source_filepath = input_filepath
+    scratch_filepath = None
+
+    if args.scratch:
+        scratch_directory = Path(args.scratch).resolve()
+        scratch_directory.mkdir(parents=True, exist_ok=True)
+        scratch_filepath = find_available_filepath((scratch_directory / basename(input_filepath)).as_posix())
+        copy2(input_filepath, scratch_filepath)
+        source_filepath = scratch_filepath
+
+    try:
+        _process_source_file(source_filepath, input_filepath, output_filepath, args, general_cli_args, threads)
+    finally:
+        if scratch_filepath:
+            remove(scratch_filepath)
+
+def _process_source_file(source_filepath: str, input_filepath: str, output_filepath: str, args: Namespace, general_cli_args: list, threads: int = None) -> None:
+    """
+    Analyze a (possibly staged) source file and generate and run the FFmpeg command
+    :param source_filepath: Path to the file FFmpeg should read (the staged copy when scratch is used)
+    :param input_filepath: Path to the original input file
+    :param output_filepath: Path to the output file
+    :param args: Parsed command line arguments
+    :param general_cli_args: Pre-generated general FFmpeg CLI arguments, shared across files
+    :param threads: Number of FFmpeg threads available for this job
+    """
 
     # Retrieve media information from the input file
-    media_info_raw_data = retrieve_media_info(args.input_filepath)
+    media_info_raw_data = retrieve_media_info(source_filepath)
+
+    if media_info_raw_data is None:
+        return
+
     media_info = MediaInfoData(media_info_raw_data)
 
     # Initialize FFmpeg settings, parameters, and run-on-finish tasks objects
-    ffmpeg_general_settings = FFmpegGeneralSettings()
     ffmpeg_render_settings = FFmpegRenderSettings()
-    run_on_finish = RunOnFinish()
+    ffmpeg_render_settings.video_section.arguments.codec = args.video_codec
+    ffmpeg_render_settings.audio_section.arguments.codec = args.audio_codec
+    ffmpeg_render_settings.subtitle_arguments.codec = args.subtitle_codec
+    ffmpeg_render_settings.video_section.filters.custom_chain = args.video_filters
+    ffmpeg_render_settings.audio_section.filters.custom_chain = args.audio_filters
+    run_on_finish = _default_run_on_finish
 
     # Calculate the best FFmpeg settings and parameters
-    ffmpeg_general_settings.calculate_best_parameters()
-    ffmpeg_render_settings.video_section.arguments.calculate_best_parameters(media_info)
-    ffmpeg_render_settings.video_section.filters.calculate_best_parameters(media_info)
-    ffmpeg_render_settings.audio_section.arguments.calculate_best_parameters(media_info)
-    ffmpeg_render_settings.audio_section.filters.calculate_best_parameters(media_info)
-    ffmpeg_render_settings.subtitle_arguments.calculate_best_parameters(media_info)
-    ffmpeg_render_settings.metadata_arguments.calculate_best_parameters(media_info)
-
-    # Generate FFmpeg CLI arguments
-    ffmpeg_cli_args = ffmpeg_general_settings.generate_cli_args()
-    ffmpeg_cli_args += ffmpeg_render_settings.generate_cli_args()
-    ffmpeg_cli_args.insert(1, '-i')
-    ffmpeg_cli_args.insert(2, args.input_filepath)
-    ffmpeg_cli_args.append(args.output_filepath)
-    clean_ffmpeg_cli_args = clean_list_items(ffmpeg_cli_args)
+    ffmpeg_render_settings.calculate_best_parameters(media_info, threads=threads)
+
+    # Generate FFmpeg CLI arguments in one shot (input options before -i, render options after it);
+    # -threads is a per-file option, so it is repeated on the output side to cap the encoder threads too
+    clean_ffmpeg_cli_args = clean_list_items([*general_cli_args, '-i', source_filepath, *ffmpeg_render_settings.generate_cli_args(), *(('-threads', str(threads)) if threads else ()), output_filepath])
 
     # Print the generated FFmpeg command
-    print(args.__dict__)
-    printdebug_class_items(ffmpeg_general_settings)
     print(clean_ffmpeg_cli_args)
 
+    # Run the generated FFmpeg command
+    exit_code = run_ffmpeg_command(clean_ffmpeg_cli_args, total_duration_ms=extract_total_duration(media_info_raw_data))
+
+    if exit_code != 0:
+        print(f'[error] FFmpeg exited with a non-zero exit code while processing the input file: {input_filepath} - Exit code: {exit_code}')
+
+def process_concat(input_filepaths: list, output_filepath: str, args: Namespace, general_cli_args: list, threads: int = None) -> None:
+    """
+    Transcode several input files in a single FFmpeg invocation using the concat demuxer
+    :param input_filepaths: Paths to the input files, in playback order
+    :param output_filepath: Path to the single output file
+    :param args: Parsed command line arguments
+    :param general_cli_args: Pre-generated general FFmpeg CLI arguments
+    :param threads: Number of FFmpeg threads available for this job
+    """
+
+    # Calculate the render settings from the first input file (all inputs share the output settings)
+    media_info_raw_data = retrieve_media_info(input_filepaths[0])
+
+    if media_info_raw_data is None:
+        exit_app(1)
+
+    media_info = MediaInfoData(media_info_raw_data)
+
+    ffmpeg_render_settings = FFmpegRenderSettings()
+    ffmpeg_render_settings.video_section.arguments.codec = args.video_codec
+    ffmpeg_render_settings.audio_section.arguments.codec = args.audio_codec
+    ffmpeg_render_settings.subtitle_arguments.codec = args.subtitle_codec
+    ffmpeg_render_settings.video_section.filters.custom_chain = args.video_filters
+    ffmpeg_render_settings.audio_section.filters.custom_chain = args.audio_filters
+    ffmpeg_render_settings.calculate_best_parameters(media_info, threads=threads)
+
+    # Write the concat demuxer list file
+    with NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as concat_list_file:
+        for input_filepath in input_filepaths:
+            escaped_filepath = input_filepath.replace("'", "'\\''")
+            concat_list_file.write(f"file '{escaped_filepath}'\n")
+
+        concat_list_filepath = concat_list_file.name
+
+    try:
+        # Generate and run the FFmpeg CLI arguments for the whole group in one shot;
+        # -threads is a per-file option, so it is repeated on the output side to cap the encoder threads too
+        clean_ffmpeg_cli_args = clean_list_items([*general_cli_args, '-f', 'concat', '-safe', '0', '-i', concat_list_filepath, *ffmpeg_render_settings.generate_cli_args(), *(('-threads', str(threads)) if threads else ()), output_filepath])
+
+        print(clean_ffmpeg_cli_args)
+        exit_code = run_ffmpeg_command(clean_ffmpeg_cli_args)
+
+        if exit_code != 0:
+            print(f'[error] FFmpeg exited with a non-zero exit code while concatenating the input files - Exit code: {exit_code}')
+    finally:
+        remove(concat_list_filepath)
+
+def app(args: Namespace) -> None:
+    """
+    Main application function
+    :param args: Parsed command line arguments
+    """
+
+    # Validate command line arguments
+    args = validate_arguments(args)
+
+    # Calculate the best general FFmpeg settings once, shared across all input files, while warming the media-info
+    # cache for the first input in parallel (both spend their time in subprocess/library code that releases the GIL)
+    ffmpeg_general_settings = FFmpegGeneralSettings()
+    max_threads = args.threads_per_job if args.threads_per_job else (max(1, available_cpu_count() // args.jobs) if args.jobs > 1 else None)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        settings_future = executor.submit(ffmpeg_general_settings.calculate_best_parameters, max_threads=max_threads, gpu_mode=args.gpu, deep_probe=args.deep_probe)
+
+        if not args.scratch:
+            executor.submit(retrieve_media_info, args.input_filepaths[0])
+
+        executor.submit(prune_media_info_cache)
+        settings_future.result()
+
+    general_cli_args = ffmpeg_general_settings.generate_cli_args()
+
+    # Print the parsed arguments and calculated general settings (debug mode only)
+    if args.debug:
+        write_stdout(str(args.__dict__))
+        printdebug_class_items(ffmpeg_general_settings)
+
+    # Concatenate all input files into a single output with one FFmpeg invocation
+    if args.concat and len(args.input_filepaths) > 1:
+        process_concat(args.input_filepaths, args.output_filepaths[0], args, general_cli_args, ffmpeg_general_settings.threads)
+        return
+
+    # Process input files, in parallel when multiple files and jobs are available
+    file_pairs = list(zip(args.input_filepaths, args.output_filepaths))
+
+    if len(file_pairs) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(file_pairs))) as executor:
+            futures = {executor.submit(process_file, input_filepath, output_filepath, args, general_cli_args, ffmpeg_general_settings.threads): input_filepath for input_filepath, output_filepath in file_pairs}
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f'[error] Failed to process input file: {futures[future]} - Internal error: {e}')
+    else:
+        for index, (input_filepath, output_filepath) in enumerate(file_pairs):
+            if index > 0 and args.pace > 0:
+                sleep(args.pace)
+
+            process_file(input_filepath, output_filepath, args, general_cli_args, ffmpeg_general_settings.threads)
+
+
+class OpenGitHubAction(Action):
+    """
+    Open the project GitHub repository in the default web browser and exit, short-circuiting like --version
+    """
+
+    def __call__(self, parser: ArgumentParser, namespace: Namespace, values: Any, option_string: str = None) -> None:
+        open_github_repository()
+        parser.exit()
+
 
 if __name__ == '__main__':
     # Parse command line arguments and run the main application
     parser = ArgumentParser(description=AppInfo.description)
     parser.add_argument('-v', '--version', action='version', version=f'{AppInfo.name} {AppInfo.version}')
-    parser.add_argument('-i', '--input-filepath',   metavar='input_filepath',  type=str, help='Input file path',           required=True)
-    parser.add_argument('-o', '--output-filepath',  metavar='output_filepath', type=str, help='Output file path',          required=True)
+    parser.add_argument('-gh', '--github', action=OpenGitHubAction, nargs=0, help='Open the project GitHub repository in the default web browser and exit')
+    parser.add_argument('-i', '--input-filepaths',  metavar='input_filepath',  type=str, help='Input file path(s)',        required=True, nargs='+')
+    parser.add_argument('-o', '--output-filepath',  metavar='output_filepath', type=str, help='Output file or directory path', required=True)
     parser.add_argument('-c:v', '--video-codec',    metavar='video_codec',     type=str, help='Codec for video stream',    default='copy')
     parser.add_argument('-c:a', '--audio-codec',    metavar='audio_codec',     type=str, help='Codec for audio stream',    default='copy')
     parser.add_argument('-c:s', '--subtitle-codec', metavar='subtitle_codec',  type=str, help='Codec for subtitle stream', default='copy')
+    parser.add_argument('-ie', '--input-extensions', metavar='extensions',     type=parse_extension_set, help='Comma-separated file extensions to include when an input path is a directory', default=None)
+    parser.add_argument('-j', '--jobs',             metavar='jobs',            type=int, help='Number of parallel transcoding jobs', default=None)
+    parser.add_argument('--threads-per-job',        metavar='threads',         type=int, help='Number of FFmpeg threads per job',    default=None)
+    parser.add_argument('-f', '--force',            action='store_true',                 help='Re-transcode even when the output file is already up to date')
+    parser.add_argument('--pace',                   metavar='seconds',         type=float, help='Delay in seconds between sequential encodes', default=0.0)
+    parser.add_argument('--no-overwrite',           action='store_true',                 help='Write to a numbered file path instead of replacing an existing output file')
+    parser.add_argument('--gpu',                    metavar='gpu_mode',        type=str, help='GPU acceleration mode', default='auto', choices=['auto', 'off', 'cuda', 'vaapi', 'd3d11va', 'qsv', 'videotoolbox', 'opencl'])
+    parser.add_argument('--concat',                 action='store_true',                 help='Concatenate all input files into a single output file with one FFmpeg invocation')
+    parser.add_argument('--deep-probe',             action='store_true',                 help='Use FFmpeg\'s full input analysis instead of the fast-start probing flags')
+    parser.add_argument('-vf', '--video-filters',   metavar='filtergraph',     type=str, help='Custom video filtergraph chain applied in the same encode', default=None)
+    parser.add_argument('-af', '--audio-filters',   metavar='filtergraph',     type=str, help='Custom audio filtergraph chain applied in the same encode', default=None)
+    parser.add_argument('--scratch',                metavar='directory',       type=str, help='Local scratch directory to stage input files into before transcoding', default=None)
+    parser.add_argument('--debug',                  action='store_true',                 help='Print the parsed arguments and calculated general settings before transcoding')
 
     app(parser.parse_args())  # CLI Command (example): py transcodash.py -i "inputs/video30.mkv" -o "inputs/video30-transcodashed.mp4" -c:v libsvtav1 -c:a libopus -c:s webvtt